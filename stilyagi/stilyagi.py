@@ -43,6 +43,9 @@ from .tengo_map import (
     update_tengo_map,
 )
 
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
 DEFAULT_MAP_NAME = "allow"
 ENV_PREFIX = "STILYAGI_"
 
@@ -326,9 +329,13 @@ def install_command(  # noqa: PLR0913 - CLI command exposes explicit flags for c
     return _perform_install(config=config)
 
 
-def main() -> None:
-    """Invoke the Cyclopts application."""
-    app()
+def main(tokens: cabc.Sequence[str] | None = None) -> None:
+    """Invoke the Cyclopts application.
+
+    ``tokens`` defaults to ``sys.argv[1:]``; tests pass explicit arguments to
+    drive the CLI in-process.
+    """
+    app(tokens)
 
 
 __all__ = [
@@ -555,16 +555,19 @@ def _replace_vale_target(lines: list[str], *, manifest: InstallManifest) -> list
 
 def _update_makefile(makefile_path: Path, *, manifest: InstallManifest) -> None:
     """Expose a vale target that syncs Concordat and runs manifest steps."""
-    if makefile_path.exists():
-        lines = makefile_path.read_text(encoding="utf-8").splitlines()
-    else:
-        lines = []
+    original_text = (
+        makefile_path.read_text(encoding="utf-8") if makefile_path.exists() else None
+    )
+    lines = original_text.splitlines() if original_text is not None else []
 
     lines = _ensure_variable(lines, "VALE", "VALE ?= vale")
     lines = _ensure_phony(lines, "vale")
     lines = _replace_vale_target(lines, manifest=manifest)
 
-    makefile_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    new_text = "\n".join(lines).rstrip() + "\n"
+    # Leave an already up-to-date Makefile untouched so make sees no change.
+    if new_text != original_text:
+        makefile_path.write_text(new_text, encoding="utf-8")
 
 
 def _parse_repo_reference(repo: str) -> tuple[str, str, str]:
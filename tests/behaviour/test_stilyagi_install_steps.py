@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import dataclasses as dc
-import os
 import subprocess
 import sys
 import typing as typ
@@ -14,18 +13,23 @@ from zipfile import ZipFile
 import pytest
 from pytest_bdd import given, scenarios, then, when
 
-FEATURE_PATH = (
-    Path(__file__).resolve().parents[2] / "features" / "stilyagi_install.feature"
-)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+FEATURE_PATH = REPO_ROOT / "features" / "stilyagi_install.feature"
 
+MANIFEST_BODY = """[install]
+style_name = "concordat"
+vocab = "manifest-vocab"
+min_alert_level = "error"
 
-scenarios(str(FEATURE_PATH))
+[[install.post_sync_steps]]
+action = "update-tengo-map"
+type = "true"
+source = ".config/common-acronyms"
+dest = ".vale/styles/config/scripts/AcronymsFirstUse.tengo"
+"""
 
 
-@pytest.fixture
-def repo_root() -> Path:
-    """Return the repository root for invoking the CLI via python -m."""
-    return Path(__file__).resolve().parents[2]
+scenarios(str(FEATURE_PATH))
 
 
 @pytest.fixture
@@ -52,9 +56,13 @@ def given_external_repo(external_repo: Path) -> Path:
 
 @when("I run stilyagi install with an explicit version")
 def run_install(
-    repo_root: Path, external_repo: Path, scenario_state: dict[str, object]
+    external_repo: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    scenario_state: dict[str, object],
 ) -> None:
     """Invoke the install sub-command with overrides to avoid network calls."""
+    # The child inherits the patched environment, so no per-call copy is needed.
+    monkeypatch.setenv("STILYAGI_SKIP_MANIFEST_DOWNLOAD", "1")
     command = [
         sys.executable,
         "-m",
@@ -71,10 +79,9 @@ def run_install(
 
     result = subprocess.run(  # noqa: S603 - arguments are repository-controlled
         command,
-        cwd=repo_root,
+        cwd=REPO_ROOT,
         capture_output=True,
         text=True,
-        env={**os.environ, "STILYAGI_SKIP_MANIFEST_DOWNLOAD": "1"},
         check=True,
     )
     scenario_state["result"] = result
@@ -85,9 +92,7 @@ def run_install(
 class _TestPaths:
     """Encapsulates test directory paths for installation testing."""
 
-    repo_root: Path
     external_repo: Path
-    tmp_path: Path
 
 
 def _run_install_with_mocked_release(
@@ -109,7 +114,7 @@ def _run_install_with_mocked_release(
         "leynos/concordat-vale"
     )
     _, ini_path, makefile_path = install_module._resolve_install_paths(  # type: ignore[attr-defined]
-        cwd=paths.repo_root,
+        cwd=REPO_ROOT,
         project_root=paths.external_repo,
         vale_ini=Path(".vale.ini"),
         makefile=Path("Makefile"),
@@ -130,19 +135,22 @@ def _run_install_with_mocked_release(
 
 
 @pytest.fixture
-def test_paths(repo_root: Path, external_repo: Path, tmp_path: Path) -> _TestPaths:
+def test_paths(external_repo: Path) -> _TestPaths:
     """Bundle shared paths for install behavioural scenarios."""
-    return _TestPaths(
-        repo_root=repo_root, external_repo=external_repo, tmp_path=tmp_path
-    )
+    return _TestPaths(external_repo=external_repo)
+
 
+@pytest.fixture(scope="session")
+def manifest_archive(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the packaged-configuration archive once per session (or worker).
 
-def _build_manifest_archive(path: Path, *, manifest_body: str) -> Path:
-    """Create a minimal archive containing the supplied stilyagi.toml."""
-    archive_path = path / "concordat-configured.zip"
+    ``tmp_path_factory`` hands each pytest-xdist worker its own base directory,
+    so the archive is never shared between processes.
+    """
+    archive_path = tmp_path_factory.mktemp("manifest") / "concordat-configured.zip"
     with ZipFile(archive_path, "w") as archive:
         archive.writestr("concordat-0.0.1/.vale.ini", "StylesPath = styles\n")
-        archive.writestr("concordat-0.0.1/stilyagi.toml", manifest_body)
+        archive.writestr("concordat-0.0.1/stilyagi.toml", MANIFEST_BODY)
 
     return archive_path
 
@@ -193,26 +201,12 @@ def run_install_failure(
 @when("I run stilyagi install with a packaged configuration")
 def run_install_with_manifest(
     test_paths: _TestPaths,
+    manifest_archive: Path,
     monkeypatch: pytest.MonkeyPatch,
     scenario_state: dict[str, object],
 ) -> None:
     """Invoke install while supplying a stilyagi.toml from the archive."""
-    manifest_body = """[install]
-style_name = "concordat"
-vocab = "manifest-vocab"
-min_alert_level = "error"
-
-[[install.post_sync_steps]]
-action = "update-tengo-map"
-type = "true"
-source = ".config/common-acronyms"
-dest = ".vale/styles/config/scripts/AcronymsFirstUse.tengo"
-"""
-
-    archive_path = _build_manifest_archive(
-        test_paths.tmp_path, manifest_body=manifest_body
-    )
-    packages_url = archive_path.as_uri()
+    packages_url = manifest_archive.as_uri()
 
     import stilyagi.stilyagi_install as install_module
 
@@ -236,7 +230,7 @@ dest = ".vale/styles/config/scripts/AcronymsFirstUse.tengo"
         "leynos/concordat-vale"
     )
     _, ini_path, makefile_path = install_module._resolve_install_paths(  # type: ignore[attr-defined]
-        cwd=test_paths.repo_root,
+        cwd=REPO_ROOT,
         project_root=test_paths.external_repo,
         vale_ini=Path(".vale.ini"),
         makefile=Path("Makefile"),
@@ -263,10 +257,8 @@ dest = ".vale/styles/config/scripts/AcronymsFirstUse.tengo"
     ]
 
 
-@then("the external repository has a configured .vale.ini")
-def verify_vale_ini(external_repo: Path, scenario_state: dict[str, object]) -> None:
-    """Assert that required sections and entries were written."""
-    ini_body = (external_repo / ".vale.ini").read_text(encoding="utf-8")
+def _verify_vale_ini_body(ini_body: str, scenario_state: dict[str, object]) -> None:
+    """Assert that required sections and entries appear in *ini_body*."""
     version = scenario_state.get("expected_version", "9.9.9-test")
     expected_url = scenario_state.get(
         "expected_packages_url",
@@ -290,10 +282,8 @@ def verify_vale_ini(external_repo: Path, scenario_state: dict[str, object]) -> N
     assert "concordat.Pronouns = NO" in ini_body, "Pronouns override should be present"
 
 
-@then("the Makefile exposes a vale target")
-def verify_makefile(external_repo: Path) -> None:
+def _verify_makefile_body(makefile: str) -> None:
     """Check the Makefile wiring that orchestrates vale."""
-    makefile = (external_repo / "Makefile").read_text(encoding="utf-8")
     assert ".PHONY: test vale" in makefile or ".PHONY: vale test" in makefile, (
         ".PHONY line should include vale"
     )
@@ -302,6 +292,20 @@ def verify_makefile(external_repo: Path) -> None:
     assert "\t$(VALE) --no-global ." in makefile, "vale target should lint workspace"
 
 
+@then("the external repository has a configured .vale.ini")
+def verify_vale_ini(external_repo: Path, scenario_state: dict[str, object]) -> None:
+    """Assert that required sections and entries were written."""
+    _verify_vale_ini_body(
+        (external_repo / ".vale.ini").read_text(encoding="utf-8"), scenario_state
+    )
+
+
+@then("the Makefile exposes a vale target")
+def verify_makefile(external_repo: Path) -> None:
+    """Check the Makefile wiring that orchestrates vale."""
+    _verify_makefile_body((external_repo / "Makefile").read_text(encoding="utf-8"))
+
+
 @then("the Makefile exposes manifest-defined post-sync steps")
 def verify_post_sync_steps(
     external_repo: Path, scenario_state: dict[str, object]
@@ -345,5 +349,7 @@ def verify_repo_reflects_manifest(
     external_repo: Path, scenario_state: dict[str, object]
 ) -> None:
     """Validate that manifest-driven settings were applied during install."""
-    verify_vale_ini(external_repo, scenario_state)
-    verify_makefile(external_repo)
+    _verify_vale_ini_body(
+        (external_repo / ".vale.ini").read_text(encoding="utf-8"), scenario_state
+    )
+    _verify_makefile_body((external_repo / "Makefile").read_text(encoding="utf-8"))
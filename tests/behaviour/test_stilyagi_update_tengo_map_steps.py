@@ -10,20 +10,18 @@ from pathlib import Path
 import pytest
 from pytest_bdd import given, scenarios, then, when
 
-FEATURE_PATH = (
-    Path(__file__).resolve().parents[2]
-    / "features"
-    / "stilyagi_update_tengo_map.feature"
-)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+FEATURE_PATH = REPO_ROOT / "features" / "stilyagi_update_tengo_map.feature"
 
 
 class ScenarioState(typ.TypedDict, total=False):
     """Mutable cross-step storage used by pytest-bdd scenarios."""
 
     project_root: Path
-    repo_root: Path
     tengo_path: Path
+    tengo_rel: str
     source_path: Path
+    source_rel: str
     source_override: str
     stdout: str
     stderr: str
@@ -33,14 +31,6 @@ class ScenarioState(typ.TypedDict, total=False):
 scenarios(str(FEATURE_PATH))
 
 
-@pytest.fixture
-def repo_root(scenario_state: ScenarioState) -> Path:
-    """Return the repository root so the CLI can run via python -m."""
-    root = Path(__file__).resolve().parents[2]
-    scenario_state["repo_root"] = root
-    return root
-
-
 @pytest.fixture
 def scenario_state() -> ScenarioState:
     """Provide mutable per-scenario storage across step functions."""
@@ -59,6 +49,7 @@ def staging_tengo_script(tmp_path: Path, scenario_state: ScenarioState) -> Path:
     )
     scenario_state["project_root"] = project_root
     scenario_state["tengo_path"] = tengo_path
+    scenario_state["tengo_rel"] = str(tengo_path.relative_to(project_root))
     return project_root
 
 
@@ -69,6 +60,7 @@ def boolean_source_list(scenario_state: ScenarioState) -> Path:
     source_path = project_root / "entries.txt"
     source_path.write_text("ALPHA\nBETA   # trailing\n", encoding="utf-8")
     scenario_state["source_path"] = source_path
+    scenario_state["source_rel"] = str(source_path.relative_to(project_root))
     return source_path
 
 
@@ -79,6 +71,7 @@ def numeric_source_list(scenario_state: ScenarioState) -> Path:
     source_path = project_root / "entries.txt"
     source_path.write_text("value=10\nfresh=3\n", encoding="utf-8")
     scenario_state["source_path"] = source_path
+    scenario_state["source_rel"] = str(source_path.relative_to(project_root))
     return source_path
 
 
@@ -96,14 +89,14 @@ def _run_update_tengo_map_for_allow(
     """Invoke the CLI targeting the default allow map with provided args."""
     return _run_update_tengo_map(
         scenario_state=scenario_state,
-        dest_argument=str(scenario_state["tengo_path"]),
+        dest_argument=scenario_state["tengo_rel"],
         extra_args=extra_args,
     )
 
 
 @when("I run stilyagi update-tengo-map for the allow map")
 def run_update_tengo_map_allow(
-    repo_root: Path, scenario_state: ScenarioState
+    scenario_state: ScenarioState,
 ) -> subprocess.CompletedProcess[str]:
     """Invoke the CLI with the default allow map."""
     return _run_update_tengo_map_for_allow(scenario_state, [])
@@ -111,10 +104,10 @@ def run_update_tengo_map_allow(
 
 @when("I run stilyagi update-tengo-map for the exceptions map with numeric values")
 def run_update_tengo_map_named_map(
-    repo_root: Path, scenario_state: ScenarioState
+    scenario_state: ScenarioState,
 ) -> subprocess.CompletedProcess[str]:
     """Invoke the CLI for the exceptions map and numeric parsing."""
-    dest_argument = f"{scenario_state['tengo_path']}::exceptions"
+    dest_argument = f"{scenario_state['tengo_rel']}::exceptions"
     return _run_update_tengo_map(
         scenario_state=scenario_state,
         dest_argument=dest_argument,
@@ -122,21 +115,6 @@ def run_update_tengo_map_named_map(
     )
 
 
-def _normalize_dest_argument(dest_argument: str, project_root: Path) -> str:
-    """Normalize dest_argument to be relative to project_root, preserving :: suffix."""
-    if "::" in dest_argument:
-        path_part, _, map_suffix = dest_argument.partition("::")
-        path_obj = Path(path_part)
-        if path_obj.is_absolute():
-            return f"{path_obj.relative_to(project_root)}::{map_suffix}"
-        return dest_argument
-
-    path_obj = Path(dest_argument)
-    if path_obj.is_absolute():
-        return str(path_obj.relative_to(project_root))
-    return dest_argument
-
-
 def _run_update_tengo_map(
     *,
     scenario_state: ScenarioState,
@@ -144,9 +122,12 @@ def _run_update_tengo_map(
     dest_argument: str,
     extra_args: list[str],
 ) -> subprocess.CompletedProcess[str]:
-    """Execute the update-tengo-map CLI and capture output in scenario state."""
-    repo_root = scenario_state["repo_root"]
-    source_path: Path = scenario_state["source_path"]
+    """Execute the update-tengo-map CLI and capture output in scenario state.
+
+    ``dest_argument`` must already be relative to the project root; the
+    ``given`` steps record relative paths once so each run avoids recomputing
+    them.
+    """
     project_root = scenario_state["project_root"]
     source_override = scenario_state.get("source_override")
     source_arg = (
@@ -154,9 +135,8 @@ def _run_update_tengo_map(
         if source_argument is not None
         else source_override
         if source_override is not None
-        else str(source_path.relative_to(project_root))
+        else scenario_state["source_rel"]
     )
-    dest_arg = _normalize_dest_argument(dest_argument, project_root)
 
     command = [
         sys.executable,
@@ -166,12 +146,12 @@ def _run_update_tengo_map(
         "--project-root",
         str(project_root),
         source_arg,
-        dest_arg,
+        dest_argument,
         *extra_args,
     ]
     result = subprocess.run(  # noqa: S603  # TODO @assistant: false positive for S603; controlled arg list in tests; see https://github.com/leynos/concordat-vale/issues/999
         command,
-        cwd=repo_root,
+        cwd=REPO_ROOT,
         check=False,
         capture_output=True,
         text=True,
@@ -185,25 +165,23 @@ def _run_update_tengo_map(
 
 @when("I run stilyagi update-tengo-map with a missing Tengo script path")
 def run_update_tengo_map_missing_tengo(
-    repo_root: Path, scenario_state: ScenarioState
+    scenario_state: ScenarioState,
 ) -> subprocess.CompletedProcess[str]:
     """Invoke the CLI when the destination Tengo script path does not exist."""
-    missing_tengo_path = scenario_state["tengo_path"].parent / "nonexistent.tengo"
+    missing_tengo_path = scenario_state["project_root"] / "nonexistent.tengo"
     assert not missing_tengo_path.exists(), (
         "Test precondition violated: missing_tengo_path unexpectedly exists"
     )
     return _run_update_tengo_map(
         scenario_state=scenario_state,
-        dest_argument=str(
-            missing_tengo_path.relative_to(scenario_state["project_root"])
-        ),
+        dest_argument=missing_tengo_path.name,
         extra_args=[],
     )
 
 
 @when("I run stilyagi update-tengo-map with an invalid value type")
 def run_update_tengo_map_invalid_type(
-    repo_root: Path, scenario_state: ScenarioState
+    scenario_state: ScenarioState,
 ) -> subprocess.CompletedProcess[str]:
     """Invoke the CLI with an invalid --type argument to exercise error handling."""
     return _run_update_tengo_map_for_allow(
@@ -214,22 +192,20 @@ def run_update_tengo_map_invalid_type(
 
 @when("I run stilyagi update-tengo-map with an escaping source path")
 def run_update_tengo_map_with_escaping_source(
-    repo_root: Path, scenario_state: ScenarioState
+    scenario_state: ScenarioState,
 ) -> subprocess.CompletedProcess[str]:
     """Invoke the CLI with a source path that attempts directory traversal."""
     scenario_state["source_override"] = "../outside-source"
     return _run_update_tengo_map(
         scenario_state=scenario_state,
-        dest_argument=str(
-            scenario_state["tengo_path"].relative_to(scenario_state["project_root"])
-        ),
+        dest_argument=scenario_state["tengo_rel"],
         extra_args=[],
     )
 
 
 @when("I run stilyagi update-tengo-map with an escaping Tengo path")
 def run_update_tengo_map_with_escaping_tengo(
-    repo_root: Path, scenario_state: ScenarioState
+    scenario_state: ScenarioState,
 ) -> subprocess.CompletedProcess[str]:
     """Invoke the CLI with a Tengo destination that attempts traversal."""
     return _run_update_tengo_map(
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import shutil
-import subprocess
-import sys
 import typing as typ
 from pathlib import Path
 from zipfile import ZipFile
@@ -12,15 +10,24 @@ from zipfile import ZipFile
 import pytest
 from pytest_bdd import given, scenarios, then, when
 
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from tests.conftest import CliResult
+
 FEATURE_PATH = Path(__file__).resolve().parents[2] / "features" / "stilyagi_zip.feature"
+ARCHIVE_VERSION = "9.9.9-test"
 
 
 class ScenarioState(typ.TypedDict, total=False):
     """Mutable cross-step storage used by pytest-bdd scenarios."""
 
     project_root: Path
-    stdout: str
     archive_path: Path
+    archive_names: frozenset[str]
+    archive_blobs: dict[str, bytes]
+    ini_settings: dict[str, str]
+    ini_sections: list[str]
     expected_styles_path: str
     expected_style_name: str
     expected_vocab: str
@@ -34,6 +41,20 @@ def _archive_member(archive_path: Path, relative: str) -> str:
     return f"{archive_path.stem}/{relative.lstrip('/')}"
 
 
+def _parse_ini_body(ini_body: str) -> tuple[dict[str, str], list[str]]:
+    """Split a ``.vale.ini`` body into root settings and section headers."""
+    settings: dict[str, str] = {}
+    sections: list[str] = []
+    for line in ini_body.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            sections.append(stripped[1:-1])
+        elif "=" in stripped and not sections:
+            key, _, value = stripped.partition("=")
+            settings[key.strip()] = value.strip()
+    return settings, sections
+
+
 def _create_sample_style(root: Path, *, style_name: str = "concordat") -> None:
     """Create a minimal style tree and vocabulary under *root*."""
     style_dir = root / "styles" / style_name
@@ -45,6 +66,33 @@ def _create_sample_style(root: Path, *, style_name: str = "concordat") -> None:
     (vocab_dir / "accept.txt").write_text("allowlist\n", encoding="utf-8")
 
 
+def _expected_style_members(
+    template_styles: Path, *, archive_root: str, style_name: str
+) -> set[str]:
+    """Map template style files to their archive members.
+
+    The template's style directory is renamed to *style_name*, while the
+    shared ``config`` tree keeps its layout.
+    """
+    members: set[str] = set()
+    for path in template_styles.rglob("*"):
+        if not path.is_file():
+            continue
+        top, *rest = path.relative_to(template_styles).parts
+        if top != "config":
+            top = style_name
+        members.add("/".join((archive_root, top, *rest)))
+    return members
+
+
+def _alias_style(source: Path, alias: Path) -> None:
+    """Expose *source* under *alias*, copying if symlinks are unavailable."""
+    try:
+        alias.symlink_to(source, target_is_directory=True)
+    except OSError:  # e.g. Windows without symlink privilege
+        shutil.copytree(source, alias)
+
+
 def _write_manifest(project_root: Path, *, style_name: str = "concordat") -> None:
     """Write a simple stilyagi manifest for packaging tests."""
     manifest = project_root / "stilyagi.toml"
@@ -60,10 +108,13 @@ def _write_manifest(project_root: Path, *, style_name: str = "concordat") -> Non
     )
 
 
-@pytest.fixture
-def repo_root() -> Path:
-    """Return the repository root so the CLI can run via python -m."""
-    return Path(__file__).resolve().parents[2]
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the sample styles tree and manifest once for cloning per test."""
+    root = tmp_path_factory.mktemp("project-template")
+    _create_sample_style(root)
+    _write_manifest(root)
+    return root
 
 
 @pytest.fixture
@@ -74,16 +125,15 @@ def scenario_state() -> ScenarioState:
 
 @given("a clean staging project containing the styles tree")
 def staging_project(
-    tmp_path: Path, repo_root: Path, scenario_state: ScenarioState
+    tmp_path: Path,
+    project_template: Path,
+    clone_tree: cabc.Callable[[Path, Path], Path],
+    scenario_state: ScenarioState,
 ) -> Path:
     """Create a temporary project with a minimal style and manifest."""
-    staging = tmp_path / "staging"
-    staging.mkdir()
-    style_name = "concordat"
-    _create_sample_style(staging, style_name=style_name)
-    _write_manifest(staging, style_name=style_name)
+    staging = clone_tree(project_template, tmp_path / "staging")
     scenario_state["project_root"] = staging
-    scenario_state["expected_vocab"] = style_name
+    scenario_state["expected_vocab"] = "concordat"
     return staging
 
 
@@ -96,7 +146,7 @@ def set_stilyagi_env_vars(
     concordat = project_root / "styles" / "concordat"
     custom_style = project_root / "styles" / "custom_concordat"
     if not custom_style.exists():
-        shutil.copytree(concordat, custom_style)
+        _alias_style(concordat, custom_style)
 
     scenario_state["expected_styles_path"] = "custom_styles"
     scenario_state["expected_style_name"] = "custom_concordat"
@@ -106,39 +156,49 @@ def set_stilyagi_env_vars(
 
 
 @when("I run stilyagi zip for that staging project")
-def run_stilyagi_zip(repo_root: Path, scenario_state: ScenarioState) -> None:
+def run_stilyagi_zip(
+    run_cli: cabc.Callable[..., CliResult], scenario_state: ScenarioState
+) -> None:
     """Invoke the CLI with an explicit version and capture its output."""
     project_root = scenario_state["project_root"]
     dist_dir = project_root / "dist"
-    command = [
-        sys.executable,
-        "-m",
-        "stilyagi.stilyagi",
+    result = run_cli(
         "zip",
         "--project-root",
         str(project_root),
         "--output-dir",
         str(dist_dir),
         "--archive-version",
-        "9.9.9-test",
+        ARCHIVE_VERSION,
         "--force",
-    ]
-    # NOTE: arguments are repository-controlled in tests.
-    result = subprocess.run(  # noqa: S603
-        command,
-        cwd=repo_root,
-        check=True,
-        capture_output=True,
-        text=True,
     )
-    stdout_lines = [line for line in result.stdout.splitlines() if line.strip()]
-    scenario_state["stdout"] = stdout_lines[-1] if stdout_lines else ""
+    assert result.returncode == 0, f"stilyagi zip failed:\n{result.stderr}"
+    # The CLI reports the archive it wrote, so no dist directory scan is needed.
+    archive_path = Path(result.stdout.strip())
+    assert archive_path.parent == dist_dir.resolve(), (
+        f"stilyagi zip reported {archive_path}, expected it under {dist_dir}"
+    )
+    assert archive_path.name.endswith(f"-{ARCHIVE_VERSION}.zip"), (
+        f"Archive name {archive_path.name} should carry version {ARCHIVE_VERSION}"
+    )
+    scenario_state["archive_path"] = archive_path
 
-    produced_archives = sorted((dist_dir).glob("*.zip"))
-    assert produced_archives, (
-        f"stilyagi zip did not create an archive in {dist_dir}:\n{result.stderr}"
+    # Snapshot the archive once so the assertions below never reopen it.
+    with ZipFile(archive_path) as archive:
+        names = frozenset(archive.namelist())
+        scenario_state["archive_names"] = names
+        scenario_state["archive_blobs"] = {
+            relative: archive.read(member)
+            for relative in (".vale.ini", "stilyagi.toml")
+            if (member := _archive_member(archive_path, relative)) in names
+        }
+    assert ".vale.ini" in scenario_state["archive_blobs"], (
+        f"Archive {archive_path.name} is missing .vale.ini"
     )
-    scenario_state["archive_path"] = produced_archives[-1]
+    ini_body = scenario_state["archive_blobs"][".vale.ini"].decode("utf-8")
+    settings, sections = _parse_ini_body(ini_body)
+    scenario_state["ini_settings"] = settings
+    scenario_state["ini_sections"] = sections
 
 
 @then("a zip archive is emitted in its dist directory")
@@ -149,124 +209,116 @@ def archive_exists(scenario_state: ScenarioState) -> None:
 
 
 @then("the archive includes the concordat content and config")
-def archive_has_content(scenario_state: ScenarioState) -> None:
-    """Verify that the archive captured both rules and shared config assets."""
+def archive_has_content(project_template: Path, scenario_state: ScenarioState) -> None:
+    """Verify that the archive holds exactly the template's rules and config."""
     archive_path = scenario_state["archive_path"]
+    styles_path = scenario_state.get("expected_styles_path", "styles")
     style_name = scenario_state.get("expected_style_name", "concordat")
-    expected_rule = f"{style_name}/OxfordComma.yml"
-    with ZipFile(archive_path) as archive:
-        names = set(archive.namelist())
-        assert any(name.endswith(expected_rule) for name in names), (
-            f"Archive missing {expected_rule}"
-        )
-        assert any("/config/" in name for name in names), (
-            "Archive missing shared config"
-        )
+    expected = _expected_style_members(
+        project_template / "styles",
+        archive_root=_archive_member(archive_path, styles_path),
+        style_name=style_name,
+    )
+    styles_prefix = _archive_member(archive_path, f"{styles_path}/")
+    actual = {
+        name
+        for name in scenario_state["archive_names"]
+        if name.startswith(styles_prefix) and not name.endswith("/")
+    }
+    missing = sorted(expected - actual)
+    unexpected = sorted(actual - expected)
+    assert (missing, unexpected) == ([], []), (
+        f"Archive styles mismatch: missing={missing}, unexpected={unexpected}"
+    )
 
 
 @then("the archive contains a .vale.ini listing only the core settings")
 def archive_has_ini(scenario_state: ScenarioState) -> None:
     """Ensure the generated .vale.ini only declares StylesPath/Vocab."""
-    archive_path = scenario_state["archive_path"]
     expected_styles_path = scenario_state.get("expected_styles_path", "styles")
     expected_vocab = scenario_state.get("expected_vocab")
-    with ZipFile(archive_path) as archive:
-        ini_body = archive.read(_archive_member(archive_path, ".vale.ini")).decode(
-            "utf-8"
-        )
-    assert f"StylesPath = {expected_styles_path}" in ini_body, (
-        f"Generated ini should point StylesPath at {expected_styles_path}/"
-    )
-    assert "BasedOnStyles" not in ini_body, "Generated ini should not set BasedOnStyles"
+    expected = {"StylesPath": expected_styles_path}
     if expected_vocab:
-        assert f"Vocab = {expected_vocab}" in ini_body, (
-            f"Generated ini should reference the {expected_vocab} vocabulary"
-        )
-    else:
-        assert "Vocab =" not in ini_body, "Ini should omit Vocab when none provided"
-    assert "[*." not in ini_body, "Generated ini should not include file globs"
+        expected["Vocab"] = expected_vocab
+    assert scenario_state["ini_settings"] == expected, (
+        "Generated ini should only declare StylesPath and, when known, Vocab"
+    )
+    assert not scenario_state["ini_sections"], (
+        "Generated ini should not include file globs"
+    )
 
 
 @then("the archive includes the stilyagi configuration manifest")
 def archive_has_manifest(scenario_state: ScenarioState) -> None:
     """Verify the manifest file is packaged alongside rules and config."""
-    archive_path = scenario_state["archive_path"]
-    with ZipFile(archive_path) as archive:
-        manifest_member = _archive_member(archive_path, "stilyagi.toml")
-        names = set(archive.namelist())
-        assert manifest_member in names, "Archive should include stilyagi.toml"
-        manifest_body = archive.read(manifest_member).decode("utf-8")
-
+    blobs = scenario_state["archive_blobs"]
+    assert "stilyagi.toml" in blobs, "Archive should include stilyagi.toml"
+    manifest_body = blobs["stilyagi.toml"].decode("utf-8")
     assert "[install]" in manifest_body, "Manifest content should be preserved"
 
 
 @then("the archive .vale.ini uses the STILYAGI_ environment variable values")
 def archive_ini_uses_env_overrides(scenario_state: ScenarioState) -> None:
     """Confirm CLI picks up STILYAGI_ overrides for .vale.ini content."""
-    archive_path = scenario_state["archive_path"]
     expected_styles_path = scenario_state["expected_styles_path"]
+    settings = scenario_state["ini_settings"]
 
-    with ZipFile(archive_path) as archive:
-        ini_body = archive.read(_archive_member(archive_path, ".vale.ini")).decode(
-            "utf-8"
-        )
-
-    assert f"StylesPath = {expected_styles_path}" in ini_body, (
-        f"Expected StylesPath {expected_styles_path}, got {ini_body!r}"
+    assert settings.get("StylesPath") == expected_styles_path, (
+        f"Expected StylesPath {expected_styles_path}, got {settings!r}"
     )
-    assert "BasedOnStyles" not in ini_body, (
+    assert "BasedOnStyles" not in settings, (
         "Generated ini should never hard-code BasedOnStyles entries"
     )
+    assert not scenario_state["ini_sections"], (
+        "Generated ini should not declare sections that could set BasedOnStyles"
+    )
 
 
-@pytest.mark.parametrize(
-    "case",
-    [
+@pytest.fixture(
+    scope="module",
+    params=[
         pytest.param("missing-project", id="missing-project"),
         pytest.param("overwrite", id="overwrite-without-force"),
     ],
 )
-def test_stilyagi_zip_cli_errors(tmp_path: Path, repo_root: Path, case: str) -> None:
-    """Validate CLI error handling for invalid inputs and overwrite attempts."""
-    if case == "missing-project":
-        project_root = tmp_path / "missing"
-        args = ["--project-root", str(project_root)]
-        expected_error = "does not exist"
-    elif case == "overwrite":
-        project_root = tmp_path / "staging"
-        project_root.mkdir()
-        _create_sample_style(project_root)
-        dist_dir = project_root / "dist"
-        dist_dir.mkdir()
-        expected_version = "9.9.9-test"
-        (dist_dir / f"concordat-{expected_version}.zip").write_bytes(b"placeholder")
-        args = [
-            "--project-root",
-            str(project_root),
-            "--output-dir",
-            str(dist_dir),
-            "--archive-version",
-            expected_version,
-        ]
-        expected_error = "already exists"
-    else:  # pragma: no cover - defensive fallback
-        pytest.fail(f"Unknown case {case}")
-
-    command = [
-        sys.executable,
-        "-m",
-        "stilyagi.stilyagi",
-        "zip",
-        *args,
+def zip_error_case(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    project_template: Path,
+    clone_tree: cabc.Callable[[Path, Path], Path],
+) -> tuple[list[str], str]:
+    """Build the CLI arguments and expected error for each failure mode.
+
+    The CLI never mutates these trees when it fails, so each case is staged
+    once per module rather than once per test run.
+    """
+    root = tmp_path_factory.mktemp(f"zip-error-{request.param}")
+    if request.param == "missing-project":
+        return ["--project-root", str(root / "missing")], "does not exist"
+
+    project_root = clone_tree(project_template, root / "staging")
+    dist_dir = project_root / "dist"
+    dist_dir.mkdir()
+    (dist_dir / f"concordat-{ARCHIVE_VERSION}.zip").write_bytes(b"placeholder")
+    args = [
+        "--project-root",
+        str(project_root),
+        "--output-dir",
+        str(dist_dir),
+        "--archive-version",
+        ARCHIVE_VERSION,
     ]
-    # NOTE: arguments come from controlled fixtures in tests.
-    result = subprocess.run(  # noqa: S603
-        command,
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    return args, "already exists"
+
+
+def test_stilyagi_zip_cli_errors(
+    zip_error_case: tuple[list[str], str],
+    run_cli: cabc.Callable[..., CliResult],
+) -> None:
+    """Validate CLI error handling for invalid inputs and overwrite attempts."""
+    args, expected_error = zip_error_case
+
+    result = run_cli("zip", *args)
 
     assert result.returncode != 0, "CLI should fail for the parametrised error scenario"
     assert expected_error in result.stderr, (
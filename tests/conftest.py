@@ -0,0 +1,129 @@
+"""Shared pytest fixtures for the stilyagi test suite."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses as dc
+import io
+import os
+import shutil
+import typing as typ
+
+import pytest
+
+from stilyagi.stilyagi import main
+
+if typ.TYPE_CHECKING:
+    import collections.abc as cabc
+    from pathlib import Path
+
+
+@dc.dataclass(frozen=True)
+class CliResult:
+    """Exit status and captured output from an in-process CLI run."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def _exit_code(exc: SystemExit, stderr: io.StringIO) -> int:
+    """Translate ``SystemExit`` the way the interpreter would at shutdown."""
+    match exc.code:
+        case None:
+            return 0
+        case int(code):
+            return code
+        case message:
+            print(message, file=stderr)
+            return 1
+
+
+def run_cli_in_process(*args: str) -> CliResult:
+    """Run ``stilyagi`` with *args* inside the test process.
+
+    Spawning ``python -m stilyagi.stilyagi`` per test pays interpreter start-up
+    and import costs that dwarf the work under test. Uncaught exceptions are
+    reported on stderr with a non-zero status, mirroring a subprocess run.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            main(list(args))
+        except SystemExit as exc:
+            returncode = _exit_code(exc, stderr)
+        except Exception as exc:  # noqa: BLE001 - report like an uncaught error
+            print(f"{type(exc).__name__}: {exc}", file=stderr)
+            returncode = 1
+    return CliResult(returncode, stdout.getvalue(), stderr.getvalue())
+
+
+@pytest.fixture
+def run_cli() -> cabc.Callable[..., CliResult]:
+    """Expose the in-process CLI runner to tests and step definitions."""
+    return run_cli_in_process
+
+
+def _clone_tree(template: Path, destination: Path) -> Path:
+    """Hard-link *template* into *destination*, copying if links fail.
+
+    Tests only add files to their clone, so shared inodes are never mutated.
+    """
+    try:
+        shutil.copytree(template, destination, copy_function=os.link)
+    except OSError:  # cross-device temp dirs or filesystems without links
+        shutil.rmtree(destination, ignore_errors=True)
+        shutil.copytree(template, destination)
+    return destination
+
+
+@pytest.fixture(scope="session")
+def clone_tree() -> cabc.Callable[[Path, Path], Path]:
+    """Expose the hard-link tree cloner to tests and step definitions."""
+    return _clone_tree
+
+
+@pytest.fixture(scope="session")
+def sample_project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a project tree with a single concordat style once per session."""
+    project_root = tmp_path_factory.mktemp("project")
+    (project_root / "styles" / "concordat").mkdir(parents=True)
+    (project_root / "styles" / "concordat" / "Rule.yml").write_text(
+        "extends: existence\n", encoding="utf-8"
+    )
+    (project_root / "styles" / "config" / "vocabularies" / "concordat").mkdir(
+        parents=True
+    )
+    (
+        project_root / "styles" / "config" / "vocabularies" / "concordat" / "accept.txt"
+    ).write_text(
+        "allowlist\n",
+        encoding="utf-8",
+    )
+    return project_root
+
+
+@pytest.fixture
+def sample_project(tmp_path: Path, sample_project_template: Path) -> Path:
+    """Return a per-test clone of the single concordat style project."""
+    return _clone_tree(sample_project_template, tmp_path / "project")
+
+
+@pytest.fixture(scope="session")
+def project_without_vocab_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a project tree that lacks shared vocabularies once per session."""
+    project_root = tmp_path_factory.mktemp("project-no-vocab")
+    (project_root / "styles" / "concordat").mkdir(parents=True)
+    (project_root / "styles" / "concordat" / "Rule.yml").write_text(
+        "extends: existence\n",
+        encoding="utf-8",
+    )
+    return project_root
+
+
+@pytest.fixture
+def project_without_vocab(tmp_path: Path, project_without_vocab_template: Path) -> Path:
+    """Return a per-test clone of the project without vocabularies."""
+    return _clone_tree(project_without_vocab_template, tmp_path / "project-no-vocab")
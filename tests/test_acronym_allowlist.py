@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import textwrap
 import typing as typ
 
@@ -13,6 +14,7 @@ if typ.TYPE_CHECKING:
     from pathlib import Path
 
 
+@functools.cache
 def _fmt(text: str) -> str:
     """Normalise multi-line snippets for readability in tests."""
     return textwrap.dedent(text).strip() + "\n"
@@ -24,41 +24,17 @@ def _default_paths_and_config(project_root: Path) -> tuple[PackagingPaths, Style
     return paths, StyleConfig()
 
 
-@pytest.fixture
-def sample_project(tmp_path: Path) -> Path:
-    """Create a temporary project tree with a single concordat style."""
-    project_root = tmp_path / "project"
-    (project_root / "styles" / "concordat").mkdir(parents=True)
-    (project_root / "styles" / "concordat" / "Rule.yml").write_text(
-        "extends: existence\n", encoding="utf-8"
-    )
-    (project_root / "styles" / "config" / "vocabularies" / "concordat").mkdir(
-        parents=True
-    )
-    (
-        project_root / "styles" / "config" / "vocabularies" / "concordat" / "accept.txt"
-    ).write_text(
-        "allowlist\n",
-        encoding="utf-8",
-    )
-    return project_root
-
-
 def _zip_member(archive_path: Path, relative: str) -> str:
     """Return the archive member path for *relative* inside *archive_path*."""
     return f"{archive_path.stem}/{relative.lstrip('/')}"
 
 
-@pytest.fixture
-def project_without_vocab(tmp_path: Path) -> Path:
-    """Create a project tree that lacks shared vocabularies."""
-    project_root = tmp_path / "project-no-vocab"
-    (project_root / "styles" / "concordat").mkdir(parents=True)
-    (project_root / "styles" / "concordat" / "Rule.yml").write_text(
-        "extends: existence\n",
-        encoding="utf-8",
-    )
-    return project_root
+def _read_archive(archive_path: Path) -> tuple[frozenset[str], str]:
+    """Open *archive_path* once and return its member names and ``.vale.ini``."""
+    with ZipFile(archive_path) as archive:
+        names = frozenset(archive.namelist())
+        ini_body = archive.read(_zip_member(archive_path, ".vale.ini")).decode("utf-8")
+    return names, ini_body
 
 
 def test_package_styles_builds_archive_with_ini_and_files(sample_project: Path) -> None:
@@ -72,15 +48,13 @@ def test_package_styles_builds_archive_with_ini_and_files(sample_project: Path)
     )
 
     assert archive_path.exists(), f"Archive not created at {archive_path}"
-    with ZipFile(archive_path) as archive:
-        namelist = set(archive.namelist())
-        assert _zip_member(archive_path, ".vale.ini") in namelist, (
-            "Missing .vale.ini in archive"
-        )
-        assert _zip_member(archive_path, "styles/concordat/Rule.yml") in namelist, (
-            "Missing styles/concordat/Rule.yml in archive"
-        )
-        ini_body = archive.read(_zip_member(archive_path, ".vale.ini")).decode("utf-8")
+    namelist, ini_body = _read_archive(archive_path)
+    assert _zip_member(archive_path, ".vale.ini") in namelist, (
+        "Missing .vale.ini in archive"
+    )
+    assert _zip_member(archive_path, "styles/concordat/Rule.yml") in namelist, (
+        "Missing styles/concordat/Rule.yml in archive"
+    )
     assert "BasedOnStyles" not in ini_body, (
         "Generated .vale.ini should not declare BasedOnStyles entries"
     )
@@ -131,8 +105,7 @@ def test_package_styles_overwrites_with_force(sample_project: Path) -> None:
     assert overwritten == archive_path, (
         "Expected overwritten archive path to match the original"
     )
-    with ZipFile(overwritten) as archive:
-        ini_body = archive.read(_zip_member(overwritten, ".vale.ini")).decode("utf-8")
+    _, ini_body = _read_archive(overwritten)
     assert "[*." not in ini_body, "Archive ini should not define target sections"
 
 
@@ -162,8 +135,7 @@ def test_package_styles_omits_vocab_when_unavailable(
         version="0.9.9",
         force=False,
     )
-    with ZipFile(archive_path) as archive:
-        ini_body = archive.read(_zip_member(archive_path, ".vale.ini")).decode("utf-8")
+    _, ini_body = _read_archive(archive_path)
     assert "Vocab =" not in ini_body, "Expected .vale.ini to omit Vocab entries"
     assert "[*." not in ini_body, "Expected ini to omit target sections"
 
@@ -172,10 +144,8 @@ def test_package_styles_omits_vocab_when_multiple_present(
     sample_project: Path,
 ) -> None:
     """Do not guess when more than one vocabulary directory exists."""
-    vocab_root = sample_project / "styles" / "config" / "vocabularies"
-    extra_vocab = vocab_root / "alt"
-    extra_vocab.mkdir(parents=True, exist_ok=True)
-    (extra_vocab / "accept.txt").write_text("alt\n", encoding="utf-8")
+    # Vocabulary discovery only looks at directory names, so an empty one counts.
+    (sample_project / "styles" / "config" / "vocabularies" / "alt").mkdir()
 
     paths, config = _default_paths_and_config(sample_project)
     archive_path = package_styles(
@@ -185,8 +155,7 @@ def test_package_styles_omits_vocab_when_multiple_present(
         force=False,
     )
 
-    with ZipFile(archive_path) as archive:
-        ini_body = archive.read(_zip_member(archive_path, ".vale.ini")).decode("utf-8")
+    _, ini_body = _read_archive(archive_path)
     assert "Vocab =" not in ini_body, (
         "Expected .vale.ini to omit Vocab entries when multiple exist"
     )
@@ -202,13 +171,10 @@ def test_package_styles_respects_ini_styles_path(sample_project: Path) -> None:
         force=True,
     )
 
-    with ZipFile(archive_path) as archive:
-        names = archive.namelist()
-        expected_prefix = _zip_member(archive_path, "custom_styles/concordat/")
-        assert any(name.startswith(expected_prefix) for name in names), (
-            "Expected archive to contain files under custom_styles/concordat/"
-        )
-        ini_body = archive.read(_zip_member(archive_path, ".vale.ini")).decode("utf-8")
+    names, ini_body = _read_archive(archive_path)
+    assert _zip_member(archive_path, "custom_styles/concordat/Rule.yml") in names, (
+        "Expected archive to contain files under custom_styles/concordat/"
+    )
     assert "StylesPath = custom_styles" in ini_body, (
         "Expected .vale.ini to contain 'StylesPath = custom_styles'"
     )
@@ -233,7 +199,7 @@ min_alert_level = "error"
     )
 
     with ZipFile(archive_path) as archive:
-        names = set(archive.namelist())
+        names = frozenset(archive.namelist())
         manifest_member = _zip_member(archive_path, "stilyagi.toml")
         assert manifest_member in names, "Archive should include stilyagi.toml"
         manifest_body = archive.read(manifest_member).decode("utf-8")
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import dataclasses as dc
 import io
+import os
+import re
 import typing as typ
 from pathlib import Path
 from zipfile import ZipFile
@@ -13,7 +15,7 @@ import pytest
 from stilyagi import stilyagi, stilyagi_install
 
 
-@dc.dataclass
+@dc.dataclass(frozen=True, slots=True)
 class _ExpectedManifest:
     """Expected values for manifest parsing assertions."""
 
@@ -29,6 +31,122 @@ DEFAULT_MANIFEST = stilyagi_install.InstallManifest(
     min_alert_level="warning",
 )
 
+REPO_REFERENCE_ERROR = re.compile(
+    r"Repository reference must be in the form ['\"]owner/name['\"]"
+)
+SECTION_HEADER = re.compile(r"^\[[^\]\n]+\]$", re.MULTILINE)
+
+
+MANIFEST_OVERRIDE_CASES = (
+    pytest.param(
+        {
+            "install": {
+                "style_name": "custom-style",
+                "vocab": "custom-vocab",
+                "min_alert_level": "error",
+            }
+        },
+        _ExpectedManifest(
+            style="custom-style", vocab="custom-vocab", min_alert="error"
+        ),
+        id="applies_overrides",
+    ),
+    pytest.param(
+        {
+            "install": {
+                "style_name": "custom-style",
+                "min_alert_level": "error",
+            }
+        },
+        _ExpectedManifest(
+            style="custom-style", vocab="custom-style", min_alert="error"
+        ),
+        id="partial_missing_vocab",
+    ),
+    pytest.param(
+        {
+            "install": {
+                "style_name": "custom-style",
+                "vocab": "custom-vocab",
+            }
+        },
+        _ExpectedManifest(
+            style="custom-style", vocab="custom-vocab", min_alert="warning"
+        ),
+        id="partial_missing_min_alert_level",
+    ),
+    pytest.param(
+        {
+            "install": {
+                "style_name": "   ",
+                "vocab": " \t ",
+                "min_alert_level": "  ",
+            }
+        },
+        _ExpectedManifest(style="concordat", vocab="concordat", min_alert="warning"),
+        id="whitespace_only_fields",
+    ),
+    pytest.param(
+        {
+            "install": {
+                "post_sync_steps": [
+                    {
+                        "action": "update-tengo-map",
+                        "source": " a ",
+                        "dest": " b ",
+                        "type": "=n",
+                    }
+                ]
+            }
+        },
+        _ExpectedManifest(
+            style="concordat",
+            vocab="concordat",
+            min_alert="warning",
+            post_sync_steps=(
+                (
+                    "uv run stilyagi update-tengo-map --source ' a ' "
+                    "--dest ' b ' --type =n"
+                ),
+            ),
+        ),
+        id="captures_post_sync_steps",
+    ),
+)
+
+
+def _zip_bytes(entries: dict[str, str]) -> bytes:
+    """Return an in-memory ZIP archive holding *entries*."""
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w") as archive:
+        for name, body in entries.items():
+            archive.writestr(name, body)
+    return buffer.getvalue()
+
+
+ARCHIVE_WITH_MANIFEST = _zip_bytes(
+    {
+        "concordat-0.0.1/stilyagi.toml": """[install]
+style_name = "manifest-style"
+vocab = "manifest-vocab"
+min_alert_level = "error"
+""",
+    }
+)
+ARCHIVE_WITHOUT_MANIFEST = _zip_bytes(
+    {
+        "concordat-0.0.1/.vale.ini": "StylesPath = styles\n",
+    }
+)
+
+
+def _load_manifest() -> stilyagi_install.InstallManifest:
+    """Load the install manifest for a fixed packages URL and style."""
+    return stilyagi_install._load_install_manifest(  # type: ignore[attr-defined]
+        packages_url="https://example.test/archive.zip",
+        default_style_name="concordat",
+    )
+
 
 def _assert_default_manifest(manifest: stilyagi_install.InstallManifest) -> None:
     assert manifest.style_name == "concordat"
@@ -91,85 +209,76 @@ def test_update_vale_ini_creates_file_and_orders_sections(tmp_path: Path) -> Non
     )
     assert "MinAlertLevel = warning" in body, "MinAlertLevel should be set"
     assert "Vocab = concordat" in body, "Vocab should match style name"
-    section_positions = [
-        body.index("[docs/**/*.{md,markdown,mdx}]"),
-        body.index("[AGENTS.md]"),
-        body.index("[*.{rs,ts,js,sh,py}]"),
-        body.index("[README.md]"),
-    ]
-    assert section_positions == sorted(section_positions), "Sections should be ordered"
+    assert SECTION_HEADER.findall(body) == [
+        "[docs/**/*.{md,markdown,mdx}]",
+        "[AGENTS.md]",
+        "[*.{rs,ts,js,sh,py}]",
+        "[README.md]",
+    ], "Sections should be ordered"
 
 
-def test_update_makefile_adds_phony_and_target(tmp_path: Path) -> None:
-    """Replace any existing vale target and merge .PHONY entries."""
+@pytest.mark.parametrize(
+    ("initial", "expected"),
+    [
+        pytest.param(
+            None,
+            ("VALE ?= vale", ".PHONY: vale"),
+            id="creates_when_missing",
+        ),
+        pytest.param(
+            (
+                ".PHONY: test\n\n"
+                "vale: ## old target\n\t@echo outdated\n\n"
+                "lint:\n\t@echo lint\n"
+            ),
+            (
+                ".PHONY: test vale",
+                "\t$(VALE) sync",
+                "\t$(VALE) --no-global .",
+                "lint:",
+            ),
+            id="replaces_target_and_merges_phony",
+        ),
+        pytest.param(
+            ".PHONY: vale test\n\nother: \n\t@echo hi\n",
+            (".PHONY: vale test", "other:"),
+            id="keeps_existing_phony",
+        ),
+        pytest.param(
+            "lint:\n\t@echo lint\n",
+            (".PHONY: vale", "lint:"),
+            id="adds_phony_when_absent",
+        ),
+    ],
+)
+def test_update_makefile_writes_vale_target(
+    tmp_path: Path, initial: str | None, expected: tuple[str, ...]
+) -> None:
+    """Add the vale target and a single .PHONY line, keeping other targets."""
     makefile = tmp_path / "Makefile"
-    makefile.write_text(
-        """.PHONY: test
-
-vale: ## old target
-\t@echo outdated
-
-lint:
-\t@echo lint
-""",
-        encoding="utf-8",
-    )
-
-    stilyagi._update_makefile(  # type: ignore[attr-defined]
-        makefile, manifest=DEFAULT_MANIFEST
-    )
+    if initial is not None:
+        makefile.write_text(initial, encoding="utf-8")
 
-    contents = makefile.read_text(encoding="utf-8")
-    assert ".PHONY: test vale" in contents, ".PHONY should include vale"
-    assert "vale: $(VALE) ## Check prose" in contents, "vale target should be rewritten"
-    assert "\t$(VALE) sync" in contents, "vale target should sync before linting"
-    assert "\t$(VALE) --no-global ." in contents, "vale target should lint workspace"
-    assert "lint:" in contents, "Other targets should remain intact"
-
-
-def test_update_makefile_creates_when_missing(tmp_path: Path) -> None:
-    """Create Makefile with VALE variable, .PHONY, and target when absent."""
-    makefile = tmp_path / "Makefile"
     stilyagi._update_makefile(makefile, manifest=DEFAULT_MANIFEST)  # type: ignore[attr-defined]
 
     contents = makefile.read_text(encoding="utf-8")
-    assert "VALE ?= vale" in contents, "VALE variable should default to vale"
-    assert any(line.lstrip().startswith(".PHONY") for line in contents.splitlines()), (
-        ".PHONY line should be present"
-    )
-    assert "vale: $(VALE) ## Check prose" in contents, "vale target should be added"
+    assert contents.count(".PHONY") == 1, "Makefile should have one .PHONY line"
+    assert "vale: $(VALE) ## Check prose" in contents, "vale target should be present"
+    assert "## old target" not in contents, "stale vale target should be replaced"
+    for snippet in expected:
+        assert snippet in contents, f"Makefile should contain {snippet!r}"
 
 
-def test_update_makefile_does_not_duplicate_phony(tmp_path: Path) -> None:
-    """Leave existing .PHONY with vale untouched."""
+def test_update_makefile_skips_write_when_up_to_date(tmp_path: Path) -> None:
+    """A second run with the same manifest leaves the Makefile untouched."""
     makefile = tmp_path / "Makefile"
-    makefile.write_text(
-        ".PHONY: vale test\n\nother: \n\t@echo hi\n",
-        encoding="utf-8",
-    )
-
     stilyagi._update_makefile(makefile, manifest=DEFAULT_MANIFEST)  # type: ignore[attr-defined]
-
-    contents = makefile.read_text(encoding="utf-8")
-    assert contents.count(".PHONY") == 1, ".PHONY should not be duplicated"
-    assert "vale: $(VALE) ## Check prose" in contents, (
-        "vale target should remain present"
-    )
-
-
-def test_update_makefile_adds_phony_when_absent(tmp_path: Path) -> None:
-    """Insert .PHONY when missing and add vale target."""
-    makefile = tmp_path / "Makefile"
-    makefile.write_text("lint:\n\t@echo lint\n", encoding="utf-8")
+    os.utime(makefile, ns=(0, 0))
 
     stilyagi._update_makefile(makefile, manifest=DEFAULT_MANIFEST)  # type: ignore[attr-defined]
 
-    contents = makefile.read_text(encoding="utf-8")
-    assert any(line.lstrip().startswith(".PHONY") for line in contents.splitlines()), (
-        ".PHONY should be inserted when absent"
-    )
-    assert "vale: $(VALE) ## Check prose" in contents, (
-        "vale target should be added when missing"
+    assert makefile.stat().st_mtime_ns == 0, (
+        "Unchanged Makefile should not be rewritten"
     )
 
 
@@ -189,23 +298,13 @@ def test_update_makefile_includes_post_sync_steps(tmp_path: Path) -> None:
     stilyagi._update_makefile(makefile, manifest=manifest)  # type: ignore[attr-defined]
 
     contents = makefile.read_text(encoding="utf-8").splitlines()
-    assert (
-        "\tuv run stilyagi update-tengo-map --source one --dest two --type true"
-        in contents
-    ), "post sync steps should be added"
-    assert (
-        "\tuv run stilyagi update-tengo-map --source three --dest four --type ="
-        in contents
-    ), "multiple steps should be preserved"
-
-    sync_idx = contents.index("\t$(VALE) sync")
-    first_step_idx = contents.index(
-        "\tuv run stilyagi update-tengo-map --source one --dest two --type true"
-    )
-    lint_idx = contents.index("\t$(VALE) --no-global .")
-    assert sync_idx < first_step_idx < lint_idx, (
-        "steps should sit between sync and lint"
-    )
+    start = contents.index("vale: $(VALE) ## Check prose")
+    assert contents[start + 1 : start + 5] == [
+        "\t$(VALE) sync",
+        "\tuv run stilyagi update-tengo-map --source one --dest two --type true",
+        "\tuv run stilyagi update-tengo-map --source three --dest four --type =",
+        "\t$(VALE) --no-global .",
+    ], "post sync steps should sit between sync and lint in manifest order"
 
 
 @pytest.mark.parametrize(
@@ -240,110 +339,30 @@ def test_parse_repo_reference_valid_inputs(
 )
 def test_parse_repo_reference_invalid_inputs(repo_ref: str) -> None:
     """_parse_repo_reference rejects malformed repo references with a clear error."""
-    with pytest.raises(
-        ValueError,
-        match=r"Repository reference must be in the form ['\"]owner/name['\"]",
-    ):
+    with pytest.raises(ValueError, match=REPO_REFERENCE_ERROR):
         stilyagi._parse_repo_reference(repo_ref)  # type: ignore[attr-defined]
 
 
-def test_parse_install_manifest_defaults() -> None:
-    """Default manifest uses provided style for vocab and alert level."""
+@pytest.mark.parametrize(
+    "raw_input",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param("not-a-dict", id="non_mapping_raw"),
+        pytest.param({"install": "not-a-dict"}, id="non_mapping_install_section"),
+    ],
+)
+def test_parse_install_manifest_defaults(raw_input: object) -> None:
+    """Absent or non-mapping manifests use the provided style and defaults."""
     manifest = stilyagi_install._parse_install_manifest(  # type: ignore[attr-defined]
-        raw=None,
+        raw=typ.cast("dict[str, object] | None", raw_input),
         default_style_name="concordat",
     )
 
     _assert_default_manifest(manifest)
 
 
-@pytest.mark.parametrize(
-    (
-        "test_id",
-        "raw_input",
-        "expected",
-    ),
-    [
-        (
-            "applies_overrides",
-            {
-                "install": {
-                    "style_name": "custom-style",
-                    "vocab": "custom-vocab",
-                    "min_alert_level": "error",
-                }
-            },
-            _ExpectedManifest(
-                style="custom-style", vocab="custom-vocab", min_alert="error"
-            ),
-        ),
-        (
-            "partial_missing_vocab",
-            {
-                "install": {
-                    "style_name": "custom-style",
-                    "min_alert_level": "error",
-                }
-            },
-            _ExpectedManifest(
-                style="custom-style", vocab="custom-style", min_alert="error"
-            ),
-        ),
-        (
-            "partial_missing_min_alert_level",
-            {
-                "install": {
-                    "style_name": "custom-style",
-                    "vocab": "custom-vocab",
-                }
-            },
-            _ExpectedManifest(
-                style="custom-style", vocab="custom-vocab", min_alert="warning"
-            ),
-        ),
-        (
-            "whitespace_only_fields",
-            {
-                "install": {
-                    "style_name": "   ",
-                    "vocab": " \t ",
-                    "min_alert_level": "  ",
-                }
-            },
-            _ExpectedManifest(
-                style="concordat", vocab="concordat", min_alert="warning"
-            ),
-        ),
-        (
-            "captures_post_sync_steps",
-            {
-                "install": {
-                    "post_sync_steps": [
-                        {
-                            "action": "update-tengo-map",
-                            "source": " a ",
-                            "dest": " b ",
-                            "type": "=n",
-                        }
-                    ]
-                }
-            },
-            _ExpectedManifest(
-                style="concordat",
-                vocab="concordat",
-                min_alert="warning",
-                post_sync_steps=(
-                    (
-                        "uv run stilyagi update-tengo-map --source ' a ' "
-                        "--dest ' b ' --type =n"
-                    ),
-                ),
-            ),
-        ),
-    ],
-)
+@pytest.mark.parametrize(("raw_input", "expected"), MANIFEST_OVERRIDE_CASES)
 def test_parse_install_manifest_overrides(
-    test_id: str,
     raw_input: dict[str, object],
     expected: _ExpectedManifest,
 ) -> None:
@@ -359,26 +378,6 @@ def test_parse_install_manifest_overrides(
     assert manifest.post_sync_steps == expected.post_sync_steps
 
 
-def test_parse_install_manifest_non_mapping_raw_uses_defaults() -> None:
-    """Non-dict manifest inputs fall back to defaults."""
-    manifest = stilyagi_install._parse_install_manifest(  # type: ignore[attr-defined]
-        raw=typ.cast("dict[str, object] | None", "not-a-dict"),
-        default_style_name="concordat",
-    )
-
-    _assert_default_manifest(manifest)
-
-
-def test_parse_install_manifest_non_mapping_install_section_uses_defaults() -> None:
-    """Non-dict install section triggers defaults."""
-    manifest = stilyagi_install._parse_install_manifest(  # type: ignore[attr-defined]
-        raw={"install": "not-a-dict"},
-        default_style_name="concordat",
-    )
-
-    _assert_default_manifest(manifest)
-
-
 def test_parse_install_manifest_rejects_string_post_sync_step() -> None:
     """String post_sync_steps are rejected as invalid."""
     with pytest.raises(TypeError):
@@ -528,43 +527,24 @@ def test_load_install_manifest_skips_download_when_env_set(
     monkeypatch.setenv("STILYAGI_SKIP_MANIFEST_DOWNLOAD", "1")
     monkeypatch.setattr(stilyagi_install, "_download_packages_archive", _download_fail)
 
-    manifest = stilyagi_install._load_install_manifest(  # type: ignore[attr-defined]
-        packages_url="https://example.test/archive.zip",
-        default_style_name="concordat",
-    )
+    manifest = _load_manifest()
 
     assert download_called is False
-    assert manifest.style_name == "concordat"
-    assert manifest.vocab_name == "concordat"
-    assert manifest.min_alert_level == "warning"
+    _assert_default_manifest(manifest)
 
 
 def test_load_install_manifest_uses_manifest_when_present(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Manifest embedded in archive is parsed and applied."""
-    buffer = io.BytesIO()
-    with ZipFile(buffer, "w") as archive:
-        archive.writestr(
-            "concordat-0.0.1/stilyagi.toml",
-            """[install]
-style_name = "manifest-style"
-vocab = "manifest-vocab"
-min_alert_level = "error"
-""",
-        )
-
     monkeypatch.delenv("STILYAGI_SKIP_MANIFEST_DOWNLOAD", raising=False)
     monkeypatch.setattr(
         stilyagi_install,
         "_download_packages_archive",
-        lambda *_args, **_kwargs: buffer.getvalue(),
+        lambda *_args, **_kwargs: ARCHIVE_WITH_MANIFEST,
     )
 
-    manifest = stilyagi_install._load_install_manifest(  # type: ignore[attr-defined]
-        packages_url="https://example.test/archive.zip",
-        default_style_name="concordat",
-    )
+    manifest = _load_manifest()
 
     assert manifest.style_name == "manifest-style"
     assert manifest.vocab_name == "manifest-vocab"
@@ -575,17 +555,13 @@ def test_load_install_manifest_defaults_when_no_manifest(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Defaults are used when archive lacks stilyagi.toml."""
-    buffer = io.BytesIO()
-    with ZipFile(buffer, "w") as archive:
-        archive.writestr("concordat-0.0.1/.vale.ini", "StylesPath = styles\n")
-
     download_called = False
     extract_called = False
 
     def _download(*_args: object, **_kwargs: object) -> bytes:
         nonlocal download_called
         download_called = True
-        return buffer.getvalue()
+        return ARCHIVE_WITHOUT_MANIFEST
 
     def _extract(_bytes: bytes) -> bytes | None:
         nonlocal extract_called
@@ -596,16 +572,11 @@ def test_load_install_manifest_defaults_when_no_manifest(
     monkeypatch.setattr(stilyagi_install, "_download_packages_archive", _download)
     monkeypatch.setattr(stilyagi_install, "_extract_stilyagi_toml", _extract)
 
-    manifest = stilyagi_install._load_install_manifest(  # type: ignore[attr-defined]
-        packages_url="https://example.test/archive.zip",
-        default_style_name="concordat",
-    )
+    manifest = _load_manifest()
 
     assert download_called is True
     assert extract_called is True
-    assert manifest.style_name == "concordat"
-    assert manifest.vocab_name == "concordat"
-    assert manifest.min_alert_level == "warning"
+    _assert_default_manifest(manifest)
 
 
 def test_load_install_manifest_falls_back_on_download_error(
@@ -619,11 +590,6 @@ def test_load_install_manifest_falls_back_on_download_error(
     monkeypatch.delenv("STILYAGI_SKIP_MANIFEST_DOWNLOAD", raising=False)
     monkeypatch.setattr(stilyagi_install, "_download_packages_archive", _download_fail)
 
-    manifest = stilyagi_install._load_install_manifest(  # type: ignore[attr-defined]
-        packages_url="https://example.test/archive.zip",
-        default_style_name="concordat",
-    )
+    manifest = _load_manifest()
 
-    assert manifest.style_name == "concordat"
-    assert manifest.vocab_name == "concordat"
-    assert manifest.min_alert_level == "warning"
+    _assert_default_manifest(manifest)
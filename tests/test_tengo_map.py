@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import dataclasses as dc
+import functools
 import textwrap
 import typing as typ
 
@@ -22,6 +23,7 @@ if __name__ == "__main__":  # pragma: no cover - defensive
     raise SystemExit
 
 
+@functools.cache
 def _fmt(text: str) -> str:
     """Normalise snippets for file writes."""
     return textwrap.dedent(text).strip() + "\n"
@@ -65,13 +67,53 @@ class _ParseTestCase:
             expected_count=3,
             expected_entries={"alpha": 3, "beta": 2},
         ),
+        _ParseTestCase(
+            contents=_fmt(
+                r"""
+                key_unquoted=foo
+                key_double_quoted="bar baz"
+                key_single_quoted="qux"
+                key_escaped="a \"quoted\" value"
+                """
+            ),
+            value_type=MapValueType.STRING,
+            expected_count=4,
+            expected_entries={
+                "key_unquoted": "foo",
+                "key_double_quoted": "bar baz",
+                "key_single_quoted": "qux",
+                "key_escaped": 'a "quoted" value',
+            },
+        ),
+        _ParseTestCase(
+            contents=_fmt(
+                """
+                alpha=true
+                beta=FALSE
+                gamma=True
+                delta=false
+                """
+            ),
+            value_type=MapValueType.BOOLEAN,
+            expected_count=4,
+            expected_entries={
+                "alpha": True,
+                "beta": False,
+                "gamma": True,
+                "delta": False,
+            },
+        ),
     ],
 )
 def test_parse_source_entries_basic_modes(
     tmp_path: Path,
     test_case: _ParseTestCase,
 ) -> None:
-    """Parse entries for TRUE and NUMBER modes with comments and overrides."""
+    """Parse entries for each value type, honouring comments and overrides.
+
+    STRING values may be unquoted, quoted, or contain escaped quotes, and
+    BOOLEAN values accept true/false in any casing.
+    """
     source = tmp_path / "entries.txt"
     source.write_text(test_case.contents, encoding="utf-8")
 
@@ -105,83 +147,22 @@ def test_parse_source_entries_supports_float_values(tmp_path: Path) -> None:
     assert entries["beta"] == pytest.approx(2.25)
 
 
-def test_parse_source_entries_rejects_invalid_boolean(tmp_path: Path) -> None:
-    """Boolean parsing rejects non true/false tokens."""
-    source = tmp_path / "entries.txt"
-    source.write_text("maybe=perhaps\n", encoding="utf-8")
-
-    with pytest.raises(TengoMapError):
-        parse_source_entries(source, MapValueType.BOOLEAN)
-
-
-def test_parse_source_entries_invalid_numeric_raises(tmp_path: Path) -> None:
-    """Non-numeric values with numeric parsing raise TengoMapError."""
+@pytest.mark.parametrize(
+    ("contents", "value_type"),
+    [
+        pytest.param("maybe=perhaps\n", MapValueType.BOOLEAN, id="boolean"),
+        pytest.param("alpha=abc\n", MapValueType.NUMBER, id="number"),
+    ],
+)
+def test_parse_source_entries_rejects_invalid_values(
+    tmp_path: Path, contents: str, value_type: MapValueType
+) -> None:
+    """Values that do not parse as the requested type raise TengoMapError."""
     source = tmp_path / "entries.txt"
-    source.write_text(
-        _fmt(
-            """
-            alpha=abc
-            """
-        ),
-        encoding="utf-8",
-    )
+    source.write_text(contents, encoding="utf-8")
 
     with pytest.raises(TengoMapError):
-        parse_source_entries(source, MapValueType.NUMBER)
-
-
-def test_parse_source_entries_string_values_with_quoted_and_unquoted(
-    tmp_path: Path,
-) -> None:
-    """STRING values support unquoted, quoted, and escaped-quote values."""
-    source = tmp_path / "entries_string.txt"
-    source.write_text(
-        _fmt(
-            r"""
-            key_unquoted=foo
-            key_double_quoted="bar baz"
-            key_single_quoted="qux"
-            key_escaped="a \"quoted\" value"
-            """
-        ),
-        encoding="utf-8",
-    )
-
-    entries_provided, entries = parse_source_entries(source, MapValueType.STRING)
-
-    assert entries_provided == 4
-    assert entries == {
-        "key_unquoted": "foo",
-        "key_double_quoted": "bar baz",
-        "key_single_quoted": "qux",
-        "key_escaped": 'a "quoted" value',
-    }
-
-
-def test_parse_source_entries_boolean_values_various_casings(tmp_path: Path) -> None:
-    """BOOLEAN values accept true/false in various casings."""
-    source = tmp_path / "entries_bool.txt"
-    source.write_text(
-        _fmt(
-            """
-            alpha=true
-            beta=FALSE
-            gamma=True
-            delta=false
-            """
-        ),
-        encoding="utf-8",
-    )
-
-    entries_provided, entries = parse_source_entries(source, MapValueType.BOOLEAN)
-
-    assert entries_provided == 4
-    assert entries == {
-        "alpha": True,
-        "beta": False,
-        "gamma": True,
-        "delta": False,
-    }
+        parse_source_entries(source, value_type)
 
 
 def test_update_tengo_map_updates_existing_and_appends_new(tmp_path: Path) -> None:
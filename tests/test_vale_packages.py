@@ -24,6 +24,8 @@ VALE_BIN = shutil.which("vale")
 SAMPLE_STYLE_NAME = "simple-style"
 SAMPLE_VOCAB_NAME = "simple"
 
+pytestmark = pytest.mark.skipif(VALE_BIN is None, reason="vale CLI not installed")
+
 
 def _run_vale_command(
     args: list[str], env: dict[str, str], cwd: Path
@@ -70,11 +72,11 @@ def _run_vale_lint(
     return _run_vale_command([str(target)], env, cwd)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def http_server(
     tmp_path_factory: pytest.TempPathFactory,
 ) -> typ.Iterator[tuple[str, Path]]:
-    """Serve files out of a temporary directory for the duration of the test."""
+    """Serve files out of a temporary directory for the whole module."""
     serve_dir = tmp_path_factory.mktemp("serve")
 
     class QuietHandler(http.server.SimpleHTTPRequestHandler):
@@ -94,40 +96,40 @@ def http_server(
     finally:
         server.shutdown()
         thread.join()
+        server.server_close()
 
 
-@pytest.mark.slow
-def test_vale_sync_accepts_packaged_archive(
-    tmp_path: Path, http_server: tuple[str, Path]
-) -> None:
-    """Package a sample style, host it, and verify `vale sync` downloads it."""
-    if VALE_BIN is None:
-        pytest.skip("vale CLI not installed")
-
+@pytest.fixture(scope="module")
+def packaged_archive_url(
+    http_server: tuple[str, Path], tmp_path_factory: pytest.TempPathFactory
+) -> str:
+    """Package the sample style once and return the URL it is served from."""
     base_url, serve_dir = http_server
-    version = "sync-test"
-    project_root = tmp_path / "package-src"
-    project_root.mkdir()
-    styles_root = project_root / "styles"
-    _create_test_style_and_vocab(styles_root)
+    project_root = tmp_path_factory.mktemp("package-src")
+    _create_test_style_and_vocab(project_root / "styles")
     archive_path = package_styles(
         paths=PackagingPaths(
             project_root=project_root,
             styles_path=Path("styles"),
-            output_dir=tmp_path,
+            output_dir=serve_dir,
         ),
         config=StyleConfig(),
-        version=version,
+        version="vale-test",
         force=True,
     )
-    served_archive = serve_dir / archive_path.name
-    shutil.copy2(archive_path, served_archive)
+    return f"{base_url}/{archive_path.name}"
+
 
+@pytest.mark.slow
+def test_vale_sync_accepts_packaged_archive(
+    tmp_path: Path, packaged_archive_url: str
+) -> None:
+    """Host the packaged sample style and verify `vale sync` downloads it."""
     vale_ini = tmp_path / ".vale.ini"
     style_name = SAMPLE_STYLE_NAME
     vale_ini.write_text(
         f"""StylesPath = styles
-Packages = {base_url}/{archive_path.name}
+Packages = {packaged_archive_url}
 
 [*.md]
 BasedOnStyles = {style_name}
@@ -171,14 +173,14 @@ def _create_test_style_and_vocab(styles_root: Path) -> tuple[Path, Path]:
 
 
 def _setup_vale_environment(
-    workspace: Path, base_url: str, archive_name: str, tmp_path: Path
+    workspace: Path, archive_url: str, tmp_path: Path
 ) -> dict[str, str]:
     vale_ini = workspace / ".vale.ini"
     vale_ini.write_text(
         textwrap.dedent(
             f"""
             StylesPath = styles
-            Packages = {base_url}/{archive_name}
+            Packages = {archive_url}
             Vocab = {SAMPLE_VOCAB_NAME}
 
             [*.md]
@@ -198,35 +200,13 @@ def _setup_vale_environment(
 
 @pytest.mark.slow
 def test_vale_lint_succeeds_after_installing_packaged_style(
-    tmp_path: Path, http_server: tuple[str, Path]
+    tmp_path: Path, packaged_archive_url: str
 ) -> None:
-    """Build a minimal style + vocab package, sync it, and lint successfully."""
-    if VALE_BIN is None:
-        pytest.skip("vale CLI not installed")
-
-    base_url, serve_dir = http_server
-    project_root = tmp_path / "package-src"
+    """Sync the packaged style + vocab and lint successfully."""
     workspace = tmp_path / "workspace"
-    project_root.mkdir()
     workspace.mkdir()
 
-    styles_root = project_root / "styles"
-    _create_test_style_and_vocab(styles_root)
-
-    archive_path = package_styles(
-        paths=PackagingPaths(
-            project_root=project_root,
-            styles_path=Path("styles"),
-            output_dir=tmp_path,
-        ),
-        config=StyleConfig(),
-        version="lint-test",
-        force=True,
-    )
-    served_archive = serve_dir / archive_path.name
-    shutil.copy2(archive_path, served_archive)
-
-    env = _setup_vale_environment(workspace, base_url, archive_path.name, tmp_path)
+    env = _setup_vale_environment(workspace, packaged_archive_url, tmp_path)
     sample_doc = workspace / "doc.md"
     sample_doc.write_text("Our codename is foobarium.\n", encoding="utf-8")
 
@@ -8,12 +8,14 @@ effects.
 
 from __future__ import annotations
 
+import dataclasses as dc
+import functools
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import time
-import typing as typ
 from pathlib import Path
 
 import pytest
@@ -21,37 +23,74 @@ import pytest
 REPO_ROOT = Path(__file__).resolve().parents[2]
 ACT_IMAGE = os.environ.get("ACT_IMAGE", "catthehacker/ubuntu:act-latest")
 ACT_JOB = "package-and-upload"
-DEFAULT_ACT_CACHE = REPO_ROOT / ".act-cache"
+# Kept outside the checkout so act runs never write into the repository, and
+# keyed by checkout so other clones, worktrees or CI jobs never share it.
+DEFAULT_ACT_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "stilyagi-act"
+    / hashlib.sha256(str(REPO_ROOT).encode()).hexdigest()[:16]
+)
+# Fields of an act JSON log entry that may carry step names or output.
+LOG_MESSAGE_KEYS = ("name", "message", "Message", "msg", "Msg", "Output", "output")
+# Paths the release job writes under ``github.workspace``: the act uv
+# installer's ``.uv-bin``, the non-act uv cache and tool dirs, the build
+# output of ``uv sync``, and the ``stilyagi zip`` archive. Keep in step with
+# .github/workflows/release.yml.
+WORKFLOW_WRITES = (".uv-bin", ".uv-cache", ".uv-tools", "build", "*.egg-info", "dist")
+# Local state the workspace must not inherit, plus WORKFLOW_WRITES so each
+# write the job makes lands in a fresh file, not an inode shared with the repo.
+WORKSPACE_IGNORE = shutil.ignore_patterns(
+    ".git",
+    ".venv",
+    ".act-cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    "__pycache__",
+    *WORKFLOW_WRITES,
+)
 
 
 def _require_act() -> None:
-    """Skip if act is unavailable on the host."""
+    """Skip if act or a reachable container runtime is unavailable."""
+    reason = _act_unavailable_reason()
+    if reason is not None:
+        pytest.skip(reason)
+
+
+@functools.cache
+def _act_unavailable_reason() -> str | None:
+    """Return why act cannot run on this host, or ``None`` when it can.
+
+    The result is cached so ``docker info`` is probed once per session.
+    """
     if shutil.which("act") is None:
-        pytest.skip(
+        return (
             "act CLI is not installed; see "
-            "docs/local-validation-of-github-actions-with-act-and-pytest.md",
+            "docs/local-validation-of-github-actions-with-act-and-pytest.md"
         )
-    _require_container_runtime()
+    return _container_runtime_problem()
 
 
-def _require_container_runtime() -> None:
-    """Ensure Docker/Podman is present and the daemon is reachable."""
+def _container_runtime_problem() -> str | None:
+    """Describe why Docker/Podman is unusable, or return ``None``."""
     cli = shutil.which("docker") or shutil.which("podman")
     if cli is None:
-        pytest.skip("Docker/Podman CLI is unavailable; cannot run act.")
-    cli = typ.cast("str", cli)
+        return "Docker/Podman CLI is unavailable; cannot run act."
     probe: subprocess.CompletedProcess[str] = subprocess.run(  # noqa: S603 - runs trusted docker/podman CLI for a health check
         [cli, "info"],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         check=False,
     )
     if probe.returncode != 0:
-        summary = probe.stdout.strip().splitlines()[-1] if probe.stdout else ""
-        pytest.skip(
+        lines = probe.stderr.strip().splitlines()
+        summary = lines[-1] if lines else ""
+        return (
             f"{cli} is not running or accessible ({summary}). "
             "Start the container runtime to run act tests."
         )
+    return None
 
 
 def _parse_json_logs(raw: str) -> list[dict[str, object]]:
@@ -68,6 +107,11 @@ def _parse_json_logs(raw: str) -> list[dict[str, object]]:
     return entries
 
 
+def _entry_mentions(entry: dict[str, object], phrase: str) -> bool:
+    """Return whether any message field of a log entry contains ``phrase``."""
+    return any(phrase in str(entry[key]) for key in LOG_MESSAGE_KEYS if key in entry)
+
+
 def _extract_uv_env(logs: str) -> dict[str, str]:
     """Return UV_* environment variables emitted by the workflow."""
     extracted: dict[str, str] = {}
@@ -83,31 +127,39 @@ def _extract_uv_env(logs: str) -> dict[str, str]:
     return extracted
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link ``src`` to ``dst``, copying when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def _copy_repo_to(workspace_root: Path) -> None:
-    """Copy the repository into a temporary workspace for isolated act runs."""
-    ignore_patterns = shutil.ignore_patterns(
-        ".git",
-        ".venv",
-        ".uv-cache",
-        ".uv-tools",
-        ".act-cache",
-        ".pytest_cache",
-        ".ruff_cache",
-        "dist",
-        "__pycache__",
-    )
+    """Clone the repository into a temporary workspace for isolated act runs.
+
+    Files are hard-linked where possible. Everything the release job writes
+    inside the workspace (``WORKFLOW_WRITES``, such as ``.uv-bin/uv`` and
+    ``dist/``) is excluded. Those writes therefore create new files rather
+    than overwriting inodes shared with the checkout.
+    """
     shutil.copytree(
         REPO_ROOT,
         workspace_root,
         symlinks=True,
-        ignore=ignore_patterns,
+        ignore=WORKSPACE_IGNORE,
+        copy_function=_link_or_copy,
     )
 
 
 def _run_release_workflow(
-    *, artifact_dir: Path, workspace_root: Path = REPO_ROOT
+    *, artifact_dir: Path, workspace_root: Path
 ) -> tuple[int, str, Path]:
-    """Invoke the release workflow with ``act workflow_dispatch``."""
+    """Invoke the release workflow with ``act workflow_dispatch``.
+
+    ``workspace_root`` is bind-mounted and written to, so callers must pass an
+    isolated copy from ``_copy_repo_to`` rather than the checkout itself.
+    """
     workflow_file = workspace_root / ".github" / "workflows" / "release.yml"
     event_file = (
         workspace_root / "tests" / "fixtures" / "workflow_dispatch_release.json"
@@ -132,7 +184,8 @@ def _run_release_workflow(
     ]
     env = os.environ.copy()
     env.setdefault("GITHUB_TOKEN", "dummy-token")
-    cache_dir = Path(env.get("ACT_CACHE_DIR", workspace_root / ".act-cache"))
+    # Share one action cache per checkout so isolated copies start warm.
+    cache_dir = Path(env.get("ACT_CACHE_DIR", DEFAULT_ACT_CACHE))
     cache_dir.mkdir(parents=True, exist_ok=True)
     env["ACT_CACHE_DIR"] = str(cache_dir)
     action_cache = cache_dir / "actions"
@@ -158,72 +211,85 @@ def _run_release_workflow(
     return completed.returncode, logs, dist_dir
 
 
+@dc.dataclass(frozen=True, slots=True)
+class _WorkflowRun:
+    """Outcome of one act run of the release workflow."""
+
+    returncode: int
+    logs: str
+    workspace_root: Path
+    dist_dir: Path
+    started_at: float
+
+    def require_success(self) -> None:
+        """Fail the calling test when act exited unsuccessfully."""
+        if self.returncode != 0:
+            pytest.fail(
+                "act workflow_dispatch failed with exit code "
+                f"{self.returncode}:\n{self.logs}"
+            )
+
+
+@pytest.fixture(scope="module")
+def release_workflow_run(tmp_path_factory: pytest.TempPathFactory) -> _WorkflowRun:
+    """Run the release workflow once in an isolated copy of the repository.
+
+    Both act tests assert on the same run, so the minutes-long workflow
+    executes once per module and never writes to the real ``dist/``.
+    """
+    _require_act()
+    run_root = tmp_path_factory.mktemp("act-release")
+    workspace_root = run_root / "workspace"
+    _copy_repo_to(workspace_root)
+    started_at = time.time()
+    code, logs, dist_dir = _run_release_workflow(
+        artifact_dir=run_root / "act-artifacts", workspace_root=workspace_root
+    )
+    return _WorkflowRun(
+        returncode=code,
+        logs=logs,
+        workspace_root=workspace_root,
+        dist_dir=dist_dir,
+        started_at=started_at,
+    )
+
+
 @pytest.mark.act
 @pytest.mark.slow
 @pytest.mark.timeout(300)
-def test_release_workflow_packages_archive(tmp_path: Path) -> None:
+def test_release_workflow_packages_archive(release_workflow_run: _WorkflowRun) -> None:
     """Ensure the release workflow packages Concordat Vale locally."""
-    _require_act()
-    artifact_dir = tmp_path / "act-artifacts"
-    dist_dir = REPO_ROOT / "dist"
-    existing_archives = {path.name for path in dist_dir.glob("*.zip")}
-    start_ts = time.time()
+    release_workflow_run.require_success()
+    logs = release_workflow_run.logs
 
-    code, logs, workflow_dist_dir = _run_release_workflow(artifact_dir=artifact_dir)
-    if code != 0:
-        pytest.fail(f"act workflow_dispatch failed with exit code {code}:\n{logs}")
-
-    archive = workflow_dist_dir / "concordat-0.1.0.zip"
+    archive = release_workflow_run.dist_dir / "concordat-0.1.0.zip"
     assert archive.exists(), f"release workflow did not emit archive:\n{logs}"
-    assert archive.stat().st_size > 0, "archive should never be empty"
-    assert archive.stat().st_mtime >= start_ts, (
+    archive_stat = archive.stat()
+    assert archive_stat.st_size > 0, "archive should never be empty"
+    assert archive_stat.st_mtime >= release_workflow_run.started_at, (
         "archive timestamp predates the act run, so packaging likely failed"
     )
 
     # Validate the structured log stream contains the packaging step output.
-    entries = _parse_json_logs(logs)
-    packaging_outputs = []
-    for entry in entries:
-        haystack = " ".join(
-            str(entry.get(key, ""))
-            for key in (
-                "name",
-                "message",
-                "Message",
-                "msg",
-                "Msg",
-                "Output",
-                "output",
-            )
-        )
-        if "Package Concordat Vale style" in haystack:
-            packaging_outputs.append(entry)
+    packaging_outputs = [
+        entry
+        for entry in _parse_json_logs(logs)
+        if _entry_mentions(entry, "Package Concordat Vale style")
+    ]
     assert packaging_outputs, f"Expected packaging step logs in the act stream:\n{logs}"
 
-    # Clean up any archives created solely by this test.
-    for path in dist_dir.glob("*.zip"):
-        if path.name not in existing_archives:
-            path.unlink()
-
 
 @pytest.mark.act
 @pytest.mark.slow
 @pytest.mark.timeout(300)
-def test_release_workflow_sets_uv_paths_under_act(tmp_path: Path) -> None:
+def test_release_workflow_sets_uv_paths_under_act(
+    release_workflow_run: _WorkflowRun,
+) -> None:
     """Assert uv paths are isolated from the workspace under act runs."""
-    _require_act()
-
-    workspace_root = tmp_path / "workspace"
-    _copy_repo_to(workspace_root)
-    artifact_dir = tmp_path / "act-artifacts"
-
-    code, logs, _dist_dir = _run_release_workflow(
-        artifact_dir=artifact_dir, workspace_root=workspace_root
-    )
-    if code != 0:
-        pytest.fail(f"act workflow_dispatch failed with exit code {code}:\n{logs}")
+    release_workflow_run.require_success()
+    workspace_root = release_workflow_run.workspace_root
 
-    uv_env = _extract_uv_env(logs)
+    uv_env = _extract_uv_env(release_workflow_run.logs)
     expected_suffixes = {
         "UV_CACHE_DIR": "concordat-vale-uv-cache",
         "UV_TOOL_DIR": "concordat-vale-uv-tools",